@@ -1,25 +1,24 @@
 # fed_speeches_all_in_one.py
-# 1) Scrape index des pages annuelles (Selenium)
-# 2) Télécharge chaque discours, extrait le texte complet et compte les mots (Requests + BS4)
+# 1) Scrape index des pages annuelles (Requests + lxml, pages statiques)
+# 2) Télécharge chaque discours, extrait le texte complet et compte les mots (Requests + lxml)
 # 3) Écrit: fed_index.csv et fed_speeches_full.csv (avec reprise)
 
 from __future__ import annotations
 
-import csv, os, re, time, random
+import csv, json, os, re, time, threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from urllib.parse import urljoin
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-
+import lxml.html
+import pandas as pd
 import requests
-from bs4 import BeautifulSoup, Tag
+from lxml import etree
+from lxml.cssselect import CSSSelector
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
@@ -34,48 +33,92 @@ OUT_DIR = Path.home() / "fed_project" / "processed"
 OUT_DIR.mkdir(parents=True, exist_ok=True)
 INDEX_CSV = OUT_DIR / "fed_index.csv"
 FULL_CSV  = OUT_DIR / "fed_speeches_full.csv"
+# ETag / Last-Modified des pages annuelles, pour des GET conditionnels au run suivant
+HTTP_CACHE_JSON = OUT_DIR / ".http_cache.json"
 
 REPROCESS_IF_WC_LT = 150
 
+# Réponses trop courtes ou sans la colonne principale (erreur, redirection, PDF) : pas de parsing
+MIN_SPEECH_BYTES = 2048
+SPEECH_BODY_MARKER = b"col-sm-8"
+# Borne mémoire par worker : au-delà, la page est abandonnée
+MAX_PAGE_BYTES = 2_000_000
+
+# Téléchargements parallèles (I/O-bound) ; le limiteur garde un débit poli
+MAX_WORKERS = 8
+MAX_REQ_PER_SEC = 8
+FULL_HEADER = ["date","title","speaker","url","word_count","text"]
+# Handle CSV ouvert pour toute la durée du run ; flush disque tous les N lots
+CSV_BUFFER_SIZE = 1 << 20
+FLUSH_EVERY_BATCHES = 5
+
 SPEECH_URL_RE = re.compile(r"/newsevents/speech/[a-z0-9-]*\d{8}[a-z]?\.htm$", re.I)
 DATE_MMDDYYYY = re.compile(r"\b\d{1,2}/\d{1,2}/\d{4}\b")
+URL_DATE_RE = re.compile(r"(\d{8})[a-z]?\.htm$")     # .../waller20251009a.htm
+CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.I)
 
-def make_driver():
-    opts = Options()
-    # opts.add_argument("--headless=new")     
-    opts.add_argument("--no-sandbox")
-    opts.add_argument("--disable-dev-shm-usage")
-    opts.add_argument("--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126 Safari/537.36")
-    service = Service(ChromeDriverManager().install())
-    return webdriver.Chrome(service=service, options=opts)
+def _as_lists(rows, header):
+    # csv.writer sur des listes : évite la conversion dict -> liste champ par champ de DictWriter
+    return [[r.get(k, "") for k in header] for r in rows]
 
 def write_rows(path: Path, rows, header):
     if not rows: return
-    file_exists = path.exists()
+    file_exists = path.exists() and path.stat().st_size > 0   # fichier vide : en-tête à écrire
     with open(path, "a", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=header)
+        w = csv.writer(f)
         if not file_exists:
-            w.writeheader()
-        w.writerows(rows)
+            w.writerow(header)
+        w.writerows(_as_lists(rows, header))
+
+def read_rows(path: Path, usecols: list[str] | None = None) -> pd.DataFrame:
+    """Lit un CSV en chaînes ("" pour les cellules vides), avec repli csv.DictReader."""
+    try:
+        return pd.read_csv(path, usecols=usecols, dtype=str, keep_default_na=False)
+    except (pd.errors.EmptyDataError, pd.errors.ParserError) as e:
+        # Fichier vide ou dernière ligne tronquée (run tué) : lecteur csv tolérant
+        print(f"[warn] {path.name} -> {e}, fallback to csv.DictReader")
+        with open(path, "r", newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+            cols = usecols or reader.fieldnames or []
+        return pd.DataFrame(rows, columns=cols).fillna("").astype(str)
+
+def _iso_date(y: int, m: int, d: int) -> str:
+    """YYYY-MM-DD, ou "" si la date n'existe pas (validée par le constructeur, sans strptime)."""
+    try:
+        datetime(y, m, d)
+    except ValueError:
+        return ""
+    return f"{y:04d}-{m:02d}-{d:02d}"
+
+# Les mêmes dates reviennent d'une ancre à l'autre : cache sur la chaîne de date trouvée
+# (et non sur le texte du conteneur ou l'URL, tous deux uniques par ancre)
+@lru_cache(maxsize=8192)
+def _mdy_to_iso(s: str) -> str:
+    mm, dd, yyyy = s.split("/")
+    return _iso_date(int(yyyy), int(mm), int(dd))
+
+@lru_cache(maxsize=8192)
+def _yyyymmdd_to_iso(s: str) -> str:
+    return _iso_date(int(s[:4]), int(s[4:6]), int(s[6:8]))
 
 def parse_date_from_text(txt: str):
     m = DATE_MMDDYYYY.search(txt or "")
     if not m: return ""
-    try:
-        dt = datetime.strptime(m.group(0), "%m/%d/%Y")
-        return dt.strftime("%Y-%m-%d")
-    except:
-        return ""
+    return _mdy_to_iso(m.group(0))
 
 def date_from_url(href: str):
-    m = re.search(r'/(\d{8})[a-z]?\.htm$', href or "")
+    m = URL_DATE_RE.search(href or "")
     if not m: return ""
-    s = m.group(1)
+    return _yyyymmdd_to_iso(m.group(1))
+
+def in_date_window(date_str: str) -> bool:
+    """Vrai si la date (YYYY-MM-DD) est >= MIN_YEAR ; une date absente ou illisible est conservée."""
+    if not date_str: return True
     try:
-        dt = datetime(int(s[:4]), int(s[4:6]), int(s[6:8]))
-        return dt.strftime("%Y-%m-%d")
-    except:
-        return ""
+        return int(date_str[:4]) >= MIN_YEAR
+    except ValueError:
+        return True
 
 def extract_speaker_from_block(text_block: str):
     if not text_block: return ""
@@ -88,60 +131,110 @@ def extract_speaker_from_block(text_block: str):
             return ln.strip()
     return ""
 
+# XPath compilés une fois : évite de re-parser l'expression pour chaque ancre
+# Forme complète d'une URL de discours testée dans l'XPath (regex EXSLT), href relatif attendu
+SPEECH_ANCHORS_XPATH = etree.XPath(f"//a[re:test(@href, '^{SPEECH_URL_RE.pattern}', 'i')]",
+                                   namespaces={"re": "http://exslt.org/regular-expressions"})
+# Conteneur non vide le plus proche (li, div.row ou article), à défaut le div parent :
+# l'ancêtre précède le parent dans l'ordre du document, d'où le [1] sur l'union
+CONTAINER_XPATH = etree.XPath(
+    "(ancestor::*[self::li or self::article or (self::div and contains(@class,'row'))]"
+    "[normalize-space()][1]"
+    " | parent::div[normalize-space()])[1]")
+
 def nearest_container(a_el):
-    XPATHS = [
-        "./ancestor::li[1]",
-        "./ancestor::div[contains(@class,'row')][1]",
-        "./ancestor::article[1]",
-        "./parent::div"
-    ]
-    for xp in XPATHS:
-        try:
-            c = a_el.find_element(By.XPATH, xp)
-            if c and c.text.strip():
-                return c
-        except:
-            pass
-    return a_el
+    found = CONTAINER_XPATH(a_el)
+    return found[0] if found else a_el
+
+def container_text(el) -> str:
+    # Un noeud texte par ligne, comme le rendu .text de Selenium : text_content() colle
+    # la date, le titre et l'orateur ("1/1/2025T20251Chair ...") et la date n'est plus trouvée
+    return "\n".join(TEXT_NODES_XPATH(el))
+
+def load_http_cache() -> dict:
+    if not HTTP_CACHE_JSON.exists(): return {}
+    try:
+        with open(HTTP_CACHE_JSON, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except:
+        return {}
+
+def save_http_cache(cache: dict):
+    with open(HTTP_CACHE_JSON, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=1)
 
-def extract_year_index(driver, year: int, seen_urls: set):
+def _html_parser(resp: requests.Response) -> lxml.html.HTMLParser:
+    """Parser qui décode selon le charset HTTP (à défaut, lxml lit le <meta charset>)."""
+    m = CHARSET_RE.search(resp.headers.get("Content-Type", ""))
+    return lxml.html.HTMLParser(encoding=m.group(1) if m else None)
+
+def fetch_year_page(session: requests.Session, year: int, http_cache: dict | None = None,
+                    limiter: RateLimiter | None = None) -> requests.Response | None:
+    """GET conditionnel d'une page annuelle (thread-safe) ; None si elle est inchangée (304)."""
+    url = YEAR_URL.format(year=year)
+    headers = {}
+    cached = (http_cache or {}).get(url) or {}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    if limiter is not None:
+        limiter.wait()
+    resp = session.get(url, headers=headers, timeout=30)
+    if resp.status_code == 304:
+        return None
+    resp.raise_for_status()
+    return resp
+
+def extract_year_index(resp: requests.Response | None, year: int, seen_urls: set,
+                       http_cache: dict | None = None):
+    """Parse une page annuelle déjà téléchargée (à appeler depuis un seul thread)."""
     url = YEAR_URL.format(year=year)
     print(f"[index {year}] {url}")
-    driver.get(url)
+    if resp is None:
+        # Page inchangée : ses lignes sont déjà dans fed_index.csv
+        print("  not modified (304), skipped")
+        return []
+    tree = lxml.html.fromstring(resp.content, parser=_html_parser(resp))
 
-    wait = WebDriverWait(driver, 20)
-    wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "a")))
-    time.sleep(0.4)
-
-    anchors = driver.find_elements(By.CSS_SELECTOR, "a[href^='/newsevents/speech/'][href$='.htm']")
+    anchors = SPEECH_ANCHORS_XPATH(tree)
     rows, new_count = [], 0
 
     for a in anchors:
         try:
-            href = a.get_attribute("href") or ""
-            if not SPEECH_URL_RE.search(href):
+            href = a.get("href") or ""
+            full_url = href if href.startswith("http") else urljoin(BASE, href)
+            if full_url in seen_urls:
                 continue
-            if href in seen_urls:
+
+            # La date encodée dans l'URL est gratuite : on filtre avant tout parcours du DOM.
+            # Elle prime sur celle du conteneur (repli seulement si l'URL n'en contient pas)
+            date_str = date_from_url(href)
+            if not in_date_window(date_str):
                 continue
 
-            title = (a.text or a.get_attribute("title") or "").strip()
+            title = clean_text(a.text_content() or a.get("title") or "")
             cont = nearest_container(a)
-            ctx = cont.text if cont else ""
+            ctx = container_text(cont) if cont is not None else ""
 
-            date_str = parse_date_from_text(ctx) or date_from_url(href)
+            date_str = date_str or parse_date_from_text(ctx)
             speaker  = extract_speaker_from_block(ctx)
 
             rows.append({
                 "date": date_str,
                 "title": title,
                 "speaker": speaker,
-                "url": href if href.startswith("http") else urljoin(BASE, href)
+                "url": full_url
             })
-            seen_urls.add(href)
+            seen_urls.add(full_url)
             new_count += 1
         except:
             continue
 
+    if http_cache is not None:
+        http_cache[url] = {"etag": resp.headers.get("ETag"),
+                           "last_modified": resp.headers.get("Last-Modified")}
     print(f"  +{new_count} new links")
     return rows
 
@@ -155,202 +248,313 @@ def make_session():
     retry = Retry(total=5, backoff_factor=0.5,
                   status_forcelist=(429,500,502,503,504),
                   allowed_methods=("GET",))
-    s.mount("https://", HTTPAdapter(max_retries=retry))
-    s.mount("http://",  HTTPAdapter(max_retries=retry))
+    # Un seul hôte : un pool, assez de connexions keep-alive pour tous les workers
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=1, pool_maxsize=32)
+    s.mount("https://", adapter)
+    s.mount("http://",  adapter)
     return s
 
-WS_RE   = re.compile(r"\s+")
+class RateLimiter:
+    """Limiteur à fenêtre glissante : au plus `rate` appels par `per` secondes, partagé entre threads."""
+
+    def __init__(self, rate: int, per: float = 1.0):
+        self.rate, self.per = rate, per
+        self.calls = deque()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            while self.calls and now - self.calls[0] >= self.per:
+                self.calls.popleft()
+            if len(self.calls) >= self.rate:
+                time.sleep(self.per - (now - self.calls[0]))
+                self.calls.popleft()
+            self.calls.append(time.monotonic())
+
 WORD_RE = re.compile(r"[A-Za-zÀ-ÖØ-öø-ÿ0-9’']+")
-FOOTNOTE_ANCHOR = re.compile(r"^fn\d+$", re.I)
+# Même classe restreinte à l'ASCII (cas de la quasi-totalité des discours), sur bytes
+FAST_ASCII_WORD_RE = re.compile(rb"[A-Za-z0-9']+")
+# Appels de note "[12]" ou "(12)", retirés en une seule passe
+FOOTNOTE_REF_RE = re.compile(r"\s*(?:\[\d+\]|\(\d+\))\s*")
 
 def clean_text(t:str) -> str:
-    return WS_RE.sub(" ", t).strip()
+    # str.split() sans argument = mêmes blancs que \s, en C et sans moteur regex
+    return " ".join(t.split())
 
 def count_words(t:str) -> int:
+    if t.isascii():
+        return len(FAST_ASCII_WORD_RE.findall(t.encode("ascii")))
     return len(WORD_RE.findall(t))
 
-def _good_para_text(t:str) -> bool:
-    if not t: return False
+# Pour un simple seuil, inutile de scanner tout le paragraphe : on s'arrête au n-ième mot
+def _count_words_upto(t:str, n:int) -> int:
+    return sum(1 for _ in islice(WORD_RE.finditer(t), n))
+
+def _has_n_words(t:str, n:int) -> bool:
+    return next(islice(WORD_RE.finditer(t), n - 1, None), None) is not None
+
+MIN_GOOD_PARA_WORDS = 25
+# n mots séparés par au moins un caractère : 2n - 1 caractères minimum
+MIN_GOOD_PARA_CHARS = 2 * MIN_GOOD_PARA_WORDS - 1
+MIN_FALLBACK_PARA_WORDS = 5
+
+def _good_para_text(t:str, wc: int | None = None) -> bool:
+    """`wc` : nombre de mots de `t` (éventuellement plafonné) s'il est déjà connu."""
+    if not t or len(t) < MIN_GOOD_PARA_CHARS: return False   # rejet sans regex (menus, légendes)
     low = t.lower()
     if "watch live" in low or low.startswith("share"): return False
     if t == "PDF": return False
-    return count_words(t) >= 25
-
-def _score_candidate(div: Tag) -> int:
+    if wc is None:
+        return _has_n_words(t, MIN_GOOD_PARA_WORDS)
+    return wc >= MIN_GOOD_PARA_WORDS
+
+# Requêtes XPath exécutées sur chaque discours, compilées une seule fois
+# Paragraphes sans ancre de note (<a name="fn12">), filtrés dans l'XPath (regex EXSLT)
+PARAS_XPATH        = etree.XPath(".//p[not(.//a[re:test(@name, '^fn[0-9]+$', 'i')])]",
+                                 namespaces={"re": "http://exslt.org/regular-expressions"})
+CONTENT_XPATH      = etree.XPath('//*[@id="content"]')
+LAST_UPDATE_XPATH  = etree.XPath('.//*[@id="lastUpdate"]')
+TEXT_NODES_XPATH   = etree.XPath(".//text()", smart_strings=False)
+
+def _para_text(p: lxml.html.HtmlElement) -> str:
+    # Noeuds texte joints par un espace, comme get_text(" ", strip=True) :
+    # text_content() les colle ("powerful<br>technology" -> "powerfultechnology")
+    return clean_text(" ".join(TEXT_NODES_XPATH(p)))
+
+def _score_candidate(div: lxml.html.HtmlElement, cap: int | None = None) -> int:
     score = 0
-    for p in div.find_all("p"):
-        if p.find("a", attrs={"name": FOOTNOTE_ANCHOR}): 
-            continue
-        txt = p.get_text(" ", strip=True)
-        if _good_para_text(txt):
+    for p in PARAS_XPATH(div):
+        if _good_para_text(_para_text(p)):
             score += 1
+            if cap is not None and score >= cap:
+                break
     return score
 
-def _pick_main_body(root: Tag) -> Tag:
-    candidates = []
-    selectors = [
-        "#content div.col-xs-12.col-sm-8.col-md-8",
-        "#content div.col-sm-8.col-md-8",
-        "#content div.col-sm-8",
-        "#content article",
-        "div.col-xs-12.col-sm-8.col-md-8",
-        "div.col-sm-8.col-md-8",
-        "div.col-sm-8",
-        "article",
-    ]
-    seen = set()
-    for sel in selectors:
-        for div in root.select(sel):
-            if id(div) in seen: 
+# Sélecteurs CSS traduits en XPath une seule fois, au chargement du module
+BODY_SELECTORS = [CSSSelector(sel, translator="html") for sel in [
+    "#content div.col-xs-12.col-sm-8.col-md-8",
+    "#content div.col-sm-8.col-md-8",
+    "#content div.col-sm-8",
+    "#content article",
+    "div.col-xs-12.col-sm-8.col-md-8",
+    "div.col-sm-8.col-md-8",
+    "div.col-sm-8",
+    "article",
+]]
+
+# Un candidat avec au moins autant de paragraphes "propres" est accepté sans essayer les sélecteurs suivants
+MIN_BODY_PARAS = 3
+# ... et au-delà de ce score, il est retenu immédiatement, sans noter les autres candidats
+CLEAR_WIN_PARAS = 10
+
+def _pick_main_body(root: lxml.html.HtmlElement) -> lxml.html.HtmlElement:
+    best, best_score = None, -1
+    scored = set()                   # les sélecteurs se recouvrent : un même div n'est noté qu'une fois
+    for sel in BODY_SELECTORS:       # par ordre de priorité
+        for div in sel(root):
+            if div in scored:
                 continue
-            seen.add(id(div))
-            candidates.append(div)
-    return max(candidates, key=_score_candidate) if candidates else root
+            scored.add(div)
+            score = _score_candidate(div, cap=CLEAR_WIN_PARAS)
+            if score >= CLEAR_WIN_PARAS:
+                return div
+            if score > best_score:
+                best, best_score = div, score
+        if best_score >= MIN_BODY_PARAS:
+            return best
+    return best if best is not None else root
+
+def _is_within(p: lxml.html.HtmlElement, stop) -> bool:
+    return stop is not None and (p is stop or any(a is stop for a in p.iterancestors()))
+
+def extract_transcript(html: str | bytes, encoding: str | None = None) -> str:
+    if not html or not html.strip():
+        return ""
+    # Sur des bytes, lxml décode lui-même (charset HTTP si fourni, sinon <meta charset>)
+    parser = lxml.html.HTMLParser(encoding=encoding) if encoding else None
+    return transcript_from_tree(lxml.html.fromstring(html, parser=parser))
 
-def extract_transcript(html: str) -> str:
-    soup = BeautifulSoup(html, "html.parser")
-    root = soup.select_one("#content") or soup
+def transcript_from_tree(tree: lxml.html.HtmlElement) -> str:
+    root = next(iter(CONTENT_XPATH(tree)), tree)
     body = _pick_main_body(root)
-    stop = root.select_one("#lastUpdate")
-
-    parts = []
-    for p in body.find_all("p", recursive=True):
-        if stop and (p is stop or stop in p.parents):
+    stop = next(iter(LAST_UPDATE_XPATH(root)), None)
+
+    # Un seul parcours : on garde (texte, nb de mots) des paragraphes d'au moins 5 mots,
+    # puis on choisit le seuil après coup (>= 25 mots "propres", sinon repli sur >= 5) ;
+    # le comptage est plafonné à 25, seul le franchissement des seuils compte ici
+    paras = []
+    for p in PARAS_XPATH(body):
+        if _is_within(p, stop):
             break
-        if p.find("a", attrs={"name": FOOTNOTE_ANCHOR}):
-            continue
-        txt = p.get_text(" ", strip=True)
-        if _good_para_text(txt):
-            parts.append(txt)
+        txt = _para_text(p)
+        wc = _count_words_upto(txt, MIN_GOOD_PARA_WORDS)
+        if wc >= MIN_FALLBACK_PARA_WORDS:
+            paras.append((txt, wc))
 
-    if not parts:  
-        for p in body.find_all("p", recursive=True):
-            if stop and (p is stop or stop in p.parents):
-                break
-            if p.find("a", attrs={"name": FOOTNOTE_ANCHOR}):
-                continue
-            txt = p.get_text(" ", strip=True)
-            if count_words(txt) >= 5:
-                parts.append(txt)
+    parts = [txt for txt, wc in paras if _good_para_text(txt, wc)]
+    if not parts:
+        parts = [txt for txt, _ in paras]
 
     text = " ".join(parts)
-    text = re.sub(r"\s*\[\d+\]\s*", " ", text)
-    text = re.sub(r"\s*\(\d+\)\s*", " ", text)
+    text = FOOTNOTE_REF_RE.sub(" ", text)
     return clean_text(text)
 
-def build_index() -> list[dict]:
+def build_index(session: requests.Session | None = None) -> list[dict]:
     """Scrape les pages annuelles et écrit fed_index.csv (avec reprise)."""
     print(f"→ Building index into {INDEX_CSV}")
-    driver = make_driver()
+    session = session or make_session()
 
     seen_urls = set()
     if INDEX_CSV.exists():
-        with open(INDEX_CSV, "r", encoding="utf-8") as f:
-            for row in csv.DictReader(f):
-                if row.get("url"):
-                    seen_urls.add(row["url"])
+        urls = read_rows(INDEX_CSV, usecols=["url"])["url"]
+        seen_urls = set(urls[urls != ""].tolist())
+    # Sans index existant, un 304 ferait perdre des lignes : on repart sans cache
+    http_cache = load_http_cache() if INDEX_CSV.exists() else {}
 
+    years = [y for y in range(YEAR_START, YEAR_END - 1, -1) if y >= MIN_YEAR]
+    limiter = RateLimiter(MAX_REQ_PER_SEC)
     total = 0
-    for year in range(YEAR_START, YEAR_END - 1, -1):
-        if year < MIN_YEAR:
-            break
-        rows = extract_year_index(driver, year, seen_urls)
+    # Les pages sont téléchargées en parallèle, puis parsées dans l'ordre des années
+    # (seen_urls, le cache HTTP et le CSV ne sont modifiés que par ce thread)
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(years) or 1)) as ex:
+        pages = {y: ex.submit(fetch_year_page, session, y, http_cache, limiter) for y in years}
+        for year in years:
+            try:
+                rows = extract_year_index(pages[year].result(), year, seen_urls, http_cache)
+            except Exception as e:
+                print(f"[warn] index {year} -> {e}")
+                continue
 
-        keep = []
-        for r in rows:
-            if r["date"]:
-                try:
-                    if datetime.strptime(r["date"], "%Y-%m-%d").year >= MIN_YEAR:
-                        keep.append(r)
-                except:
-                    keep.append(r)
-            else:
-                keep.append(r)
-
-        write_rows(INDEX_CSV, keep, header=["date","title","speaker","url"])
-        total += len(keep)
-        time.sleep(random.uniform(0.6, 1.2))
-
-    driver.quit()
-    print(f"Index done. +{total} rows written.")
-    with open(INDEX_CSV, "r", encoding="utf-8") as f:
-        return list(csv.DictReader(f))
+            keep = [r for r in rows if in_date_window(r["date"])]
+
+            write_rows(INDEX_CSV, keep, header=["date","title","speaker","url"])
+            total += len(keep)
 
-def build_full(index_rows: list[dict]):
+    save_http_cache(http_cache)
+    print(f"Index done. +{total} rows written.")
+    if not INDEX_CSV.exists():
+        return []
+    # Chaînes vides (et non NaN) pour les cellules vides, comme csv.DictReader
+    return read_rows(INDEX_CSV).to_dict("records")
+
+def _fetch_tree(session: requests.Session, url: str,
+                max_bytes: int = MAX_PAGE_BYTES) -> lxml.html.HtmlElement | None:
+    """GET en streaming, parsé par lxml au fil des chunks reçus (au plus max_bytes).
+
+    Renvoie la racine du document, ou None si la réponse ne peut pas contenir de discours.
+    """
+    with session.get(url, stream=True, timeout=30) as resp:
+        resp.raise_for_status()
+        parser = _html_parser(resp)
+        size, has_marker, tail = 0, False, b""
+        for chunk in resp.iter_content(chunk_size=1 << 16):
+            size += len(chunk)
+            if size > max_bytes:
+                raise ValueError(f"response body exceeds {max_bytes} bytes")
+            if not has_marker:   # le marqueur peut chevaucher deux chunks
+                window = tail + chunk
+                has_marker = SPEECH_BODY_MARKER in window
+                tail = window[-(len(SPEECH_BODY_MARKER) - 1):]
+            parser.feed(chunk)
+    if size <= MIN_SPEECH_BYTES or not has_marker:
+        return None
+    return parser.close()
+
+def _fetch_and_extract(url: str, meta: dict, session: requests.Session,
+                       limiter: RateLimiter) -> dict:
+    """Télécharge un discours et construit sa ligne CSV (exécuté dans un worker)."""
+    limiter.wait()
+    tree = _fetch_tree(session, url)
+    if tree is not None:
+        text = transcript_from_tree(tree)
+    else:
+        text = ""   # ligne écrite quand même (word_count=0 -> retentée au prochain run)
+    return {
+        "date": meta.get("date",""),
+        "title": meta.get("title",""),
+        "speaker": meta.get("speaker",""),
+        "url": url,
+        "word_count": count_words(text),
+        "text": text
+    }
+
+def build_full(index_rows: list[dict], session: requests.Session | None = None):
     """Télécharge les discours & écrit fed_speeches_full.csv (reprise intelligente)."""
     print(f"→ Building full into {FULL_CSV}")
-    done_ok, redo = set(), set()
+    done_ok = set()
     if FULL_CSV.exists():
-        with open(FULL_CSV, "r", encoding="utf-8") as f:
-            for r in csv.DictReader(f):
-                url = (r.get("url") or "").strip()
-                if not url: 
-                    continue
-                try:
-                    wc = int(r.get("word_count") or 0)
-                except:
-                    wc = 0
-                if wc < REPROCESS_IF_WC_LT:
-                    redo.add(url)
-                else:
-                    done_ok.add(url)
-
-    if not FULL_CSV.exists():
-        with open(FULL_CSV, "w", newline="", encoding="utf-8") as f:
-            w = csv.DictWriter(f, fieldnames=[
-                "date","title","speaker","url","word_count","text"
-            ])
-            w.writeheader()
-
-    s = make_session()
-    batch, total = [], 0
+        # Lecture C (pandas) des deux seules colonnes utiles, sans dict Python par ligne
+        df = read_rows(FULL_CSV, usecols=["url","word_count"])
+        urls = df["url"].str.strip()
+        has_url = urls != ""
+        wc = pd.to_numeric(df["word_count"], errors="coerce").fillna(0)
+        done_ok = set(urls[has_url & (wc >= REPROCESS_IF_WC_LT)].tolist())
+
+    # Un fichier vide (run tué avant le premier flush) n'a pas d'en-tête : on le réécrit
+    new_file = not FULL_CSV.exists() or FULL_CSV.stat().st_size == 0
+
+    todo, queued = [], set()
     for r in index_rows:
         url = (r.get("url") or "").strip()
         if not url: 
             continue
-        if url in done_ok:      
+        if url in done_ok or url in queued:
             continue
-
+        if not in_date_window(r.get("date","")):
+            continue
+        queued.add(url)
+        todo.append((url, r))
+
+    s = session or make_session()
+    limiter = RateLimiter(MAX_REQ_PER_SEC)
+    batch, total, n_batches = [], 0, 0
+    with open(FULL_CSV, "a", newline="", encoding="utf-8",
+              buffering=CSV_BUFFER_SIZE) as f, \
+         ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        writer = csv.writer(f)
+        if new_file:
+            writer.writerow(FULL_HEADER)
+            f.flush()   # en-tête sur disque avant la première ligne
+
+        futures = {ex.submit(_fetch_and_extract, url, r, s, limiter): url
+                   for url, r in todo}
+        # Les résultats sont consommés (et écrits) dans le thread principal uniquement
         try:
-            resp = s.get(url, timeout=30)
-            resp.raise_for_status()
-            text = extract_transcript(resp.text)
-            wc = count_words(text)
-            row = {
-                "date": r.get("date",""),
-                "title": r.get("title",""),
-                "speaker": r.get("speaker",""),
-                "url": url,
-                "word_count": wc,
-                "text": text
-            }
-            batch.append(row); total += 1
-
-            if len(batch) >= 20:
-                write_rows(FULL_CSV, batch, header=[
-                    "date","title","speaker","url","word_count","text"
-                ])
-                print(f"  wrote {len(batch)} rows (progress {total})")
-                batch = []
-
-            time.sleep(0.15)
-        except Exception as e:
-            print(f"[warn] {url} -> {e}")
-
-    if batch:
-        write_rows(FULL_CSV, batch, header=[
-            "date","title","speaker","url","word_count","text"
-        ])
-        print(f"  wrote {len(batch)} rows (final)")
+            for fut in as_completed(futures):
+                try:
+                    row = fut.result()
+                except Exception as e:
+                    print(f"[warn] {futures[fut]} -> {e}")
+                    continue
+                batch.append(row); total += 1
+
+                if len(batch) >= 20:
+                    writer.writerows(_as_lists(batch, FULL_HEADER))
+                    n_batches += 1
+                    if n_batches % FLUSH_EVERY_BATCHES == 0:
+                        f.flush()
+                    print(f"  wrote {len(batch)} rows (progress {total})")
+                    batch = []
+        finally:
+            # Fin normale, Ctrl-C ou erreur : les lignes reçues sont écrites,
+            # les téléchargements encore en file sont annulés (seuls ceux en cours se terminent)
+            if batch:
+                writer.writerows(_as_lists(batch, FULL_HEADER))
+                print(f"  wrote {len(batch)} rows (final)")
+            ex.shutdown(cancel_futures=True)
 
     print(f"Full done. New/updated rows: {total}")
 
 def main():
-    # Étape 1 — index (Selenium)
-    index_rows = build_index()
+    # Une session partagée : connexions TLS réutilisées de l'index aux discours
+    session = make_session()
+
+    # Étape 1 — index (Requests + lxml)
+    index_rows = build_index(session)
 
-    # Étape 2 — textes (Requests + BS4)
-    build_full(index_rows)
+    # Étape 2 — textes (Requests + lxml)
+    build_full(index_rows, session)
 
     print(f"\nCSV index   → {INDEX_CSV}")
     print(f"CSV full    → {FULL_CSV}")